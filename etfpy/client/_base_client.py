@@ -1,3 +1,4 @@
+import functools
 from typing import Any, Dict
 
 import pandas as pd
@@ -10,6 +11,13 @@ from etfpy.utils import get_headers, get_retry_session
 logger = get_logger(__name__)
 
 
+@functools.lru_cache()
+def get_shared_session() -> requests.Session:
+    """Returns a retry session shared by all clients, so that every client
+    reuses the same pool of keep-alive connections."""
+    return get_retry_session()
+
+
 class BaseClient:
     """Base client for interacting with the etfdb API.
 
@@ -24,8 +32,8 @@ class BaseClient:
         The base URL for the etfdb API.
     _api_url: str
         The URL for the etfdb screener API.
-    _request_session: requests.Session
-        A session object used to make all requests.
+    _requests_session: requests.Session
+        A session object used to make all requests, shared between clients.
     """
 
     def __init__(self, **kwargs: Any):
@@ -34,7 +42,7 @@ class BaseClient:
         self._quotes_url = (
             "https://etfflows.websol.barchart.com/proxies/timeseries/queryeod.ashx"
         )
-        self._requests_session = get_retry_session()
+        self._requests_session = get_shared_session()
 
         for k, v in kwargs.items():
             setattr(self, k, v)
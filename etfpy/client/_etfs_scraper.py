@@ -1,5 +1,8 @@
+import functools
 import itertools
-from typing import Any, Dict, Generator, List
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Generator, List, Optional
 
 from requests.exceptions import ConnectionError, Timeout
 
@@ -28,35 +31,60 @@ class ETFListScraper(BaseClient):
             The parsed ETF record.
 
         """
-
+        symbol = obj.get("symbol") or {}
+        url = symbol.get("url")
         return {
-            "symbol": obj.get("symbol", {}).get("text"),
+            "symbol": symbol.get("text"),
             "asset_class": obj.get("asset_class"),
             "price": obj.get("price"),
             "average_volume": obj.get("average_volume"),
-            "name": obj.get("name", {}).get("text"),
-            "url": self._base_url + obj.get("symbol", {}).get("url"),
+            "name": (obj.get("name") or {}).get("text"),
+            "url": self._base_url + url if url is not None else None,
             "one_year_return": obj.get("ytd"),
         }
 
-    def _prepare_etfs_list(
-        self, etfs: List[dict]
-    ) -> Generator[Dict[str, Any], None, None]:
-        """Prepares a list of ETFs for parsing.
+    def _prepare_etfs_list(self, etfs: List[dict]) -> List[Dict[str, Any]]:
+        """Parses a list of ETF records.
 
         Parameters
         ----------
         etfs: List[dict]
             The list of ETFs.
 
-        Yields
-        ------
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The parsed ETF records.
+
+        """
+        return [self._parse_etf_record(etf) for etf in etfs]
+
+    def _fetch_page(self, page: int, page_size=250) -> Dict[str, Any]:
+        """Fetches a page of the ETFDB screener API response.
+
+        Parameters
+        ----------
+        page: int
+            The page number to fetch.
+        page_size: int, default=250
+            The number of ETFs to fetch per page.
+
+        Returns
+        -------
         Dict[str, Any]
-            A parsed ETF record.
+            The response body with "meta" and "data" sections,
+            or an empty dict if the request failed.
 
         """
-        for etf in etfs:
-            yield self._parse_etf_record(etf)
+        logger.debug("getting data for page: %s with page_size: %s", page, page_size)
+        request_body = self._prepare_request_body(page=page, page_size=page_size)
+        try:
+            return self.post_request(request_body).json()
+        except (ConnectionError, Timeout) as e:
+            logger.error("connection timeout: %s", str(e))
+        except AttributeError as e:
+            logger.error("another exception happened: %s", str(e))
+        return {}
 
     def _scrape_page(self, page: int, page_size=250) -> List[Dict[Any, Any]]:
         """Scrapes a page of ETFs from the ETFDB API.
@@ -73,33 +101,58 @@ class ETFListScraper(BaseClient):
         List[dict]
             A list of ETF records.
 
-        Raises
-        ------
-        ConnectionError
-            If there is a connection error.
-        Timeout
-            If the request times out.
-
         """
-        logger.debug("getting data for page: %s with page_size: %s", page, page_size)
-        request_body = self._prepare_request_body(page=page, page_size=page_size)
         try:
-            return self.post_request(request_body).json()["data"]
-        except (ConnectionError, Timeout) as e:
-            logger.error("connection timeout: %s", str(e))
-        except (AttributeError, KeyError) as e:
+            return self._fetch_page(page, page_size)["data"]
+        except KeyError as e:
             logger.error("another exception happened: %s", str(e))
         return []
 
+    @staticmethod
+    def _count_pages(meta: Dict[str, Any], page_size: int) -> Optional[int]:
+        """Gets the number of pages from the screener response metadata.
+
+        Parameters
+        ----------
+        meta: Dict[str, Any]
+            The "meta" section of the screener response.
+        page_size: int
+            The number of ETFs per page returned by the server.
+
+        Returns
+        -------
+        Optional[int]
+            The number of pages, or None if metadata doesn't contain it.
+
+        """
+        try:
+            if meta.get("total_pages") is not None:
+                return int(meta["total_pages"])
+            if meta.get("total_records") is not None:
+                return math.ceil(int(meta["total_records"]) / page_size)
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.warning("couldn't get number of pages: %s", str(e))
+        return None
+
     def get_etfs(
-        self, page_size: int = 250
+        self, page_size: int = 250, max_workers: int = 8
     ) -> Generator[List[Dict[str, Any]], None, None]:
         """Scrapes all ETFs from the ETFDB API.
 
+        The first page is used to find out the total number of pages
+        and the number of ETFs per page, the remaining pages are then scraped concurrently and yielded in order.
+        If the response metadata doesn't contain the number of pages,
+        pages are requested one by one until an empty one is returned.
+        A page that comes back empty although it should contain ETFs
+        is retried once, if it's still empty an exception is raised,
+        so the returned list never has holes in it.
+
         Parameters
         ----------
         page_size: int, default=250
             The number of ETFs to scrape per page.
+        max_workers: int, default=8
+            The number of pages scraped concurrently.
 
         Yields
         ------
@@ -107,22 +160,44 @@ class ETFListScraper(BaseClient):
             A list of parsed ETF records.
 
         """
-        page = 1
-        while True:
-            etfs = self._scrape_page(page, page_size)
-            if not etfs:
-                break
-            yield list(self._prepare_etfs_list(etfs))
-            page += 1
-
-
-def get_all_etfs(page_size: int = 250) -> List[Dict[str, Any]]:
+        first_page = self._fetch_page(1, page_size)
+        etfs = first_page.get("data")
+        if not etfs:
+            return
+        yield self._prepare_etfs_list(etfs)
+
+        meta = first_page.get("meta") or {}
+        # the server may cap the page size below the requested one
+        total_pages = self._count_pages(meta, meta.get("per_page") or len(etfs))
+        if total_pages is None:
+            for page in itertools.count(2):
+                etfs = self._scrape_page(page, page_size)
+                if not etfs:
+                    break
+                yield self._prepare_etfs_list(etfs)
+            return
+
+        scrape_page = functools.partial(self._scrape_page, page_size=page_size)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = range(2, total_pages + 1)
+            for page, etfs in zip(pages, executor.map(scrape_page, pages)):
+                if not etfs:
+                    logger.warning("page %s is empty, retrying", page)
+                    etfs = self._scrape_page(page, page_size)
+                if not etfs:
+                    raise Exception(f"couldn't scrape page {page} of {total_pages}")
+                yield self._prepare_etfs_list(etfs)
+
+
+def get_all_etfs(page_size: int = 250, max_workers: int = 8) -> List[Dict[str, Any]]:
     """Scrapes all ETFs from the ETFDB API and returns them as a list.
 
     Parameters
     ----------
     page_size: int, default=250
         The number of ETFs to scrape per page.
+    max_workers: int, default=8
+        The number of pages scraped concurrently.
 
     Returns
     -------
@@ -131,5 +206,5 @@ def get_all_etfs(page_size: int = 250) -> List[Dict[str, Any]]:
 
     """
 
-    etfs_gen = ETFListScraper().get_etfs(page_size)
+    etfs_gen = ETFListScraper().get_etfs(page_size, max_workers)
     return list(itertools.chain(*etfs_gen))
@@ -1,27 +1,52 @@
 import functools
-import json
 import os
-import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import bs4
+import orjson
 
 from etfpy.client._base_client import BaseClient
+from etfpy.deco import cached_section
 from etfpy.exc import InvalidETFException
 from etfpy.log import get_logger
 from etfpy.utils import (
     _handle_nth_child,
     _handle_spans,
-    chunkify,
+    _nth_child_selector,
     handle_find_all_rows,
     handle_tbody_thead,
 )
 
 logger = get_logger("etf_client")
 
+HTML_PARSER = "lxml"
 
+
+class _AnyOfStrainer(bs4.ElementFilter):
+    """Lets the parser create only the tags matched by any of the given strainers."""
+
+    def __init__(self, *strainers: bs4.SoupStrainer):
+        super().__init__()
+        self.strainers = strainers
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return any(s.allow_tag_creation(nsprefix, name, attrs) for s in self.strainers)
+
+
+# the sections read by the single-purpose methods:
+# holdings, number of holdings, size, dividends and exposure charts
+SECTIONS_STRAINER = _AnyOfStrainer(
+    bs4.SoupStrainer(
+        id=["holding_section", "holdings-table", "size-table", "dividend-table"]
+    ),
+    bs4.SoupStrainer("table", {"class": "chart base-table"}),
+)
+
+
+@functools.lru_cache()
 def _load_available_etfs() -> list:
     """Loads all available tickers from etfdb.com
 
@@ -32,8 +57,8 @@ def _load_available_etfs() -> list:
     root = Path(__file__).parent.parent.resolve()
     path = os.path.join(root, "data", "etfs", "etfs_list.json")
 
-    with open(path, "r") as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        data = orjson.loads(f.read())
     return data
 
 
@@ -42,24 +67,68 @@ def get_available_etfs_list():
     return [etf["symbol"] for etf in _load_available_etfs()]
 
 
+@functools.lru_cache()
+def _get_asset_classes() -> Dict[str, str]:
+    """Maps every available etf ticker to its asset class.
+
+    Returns
+    -------
+    dict of etf ticker to asset class, for constant time ticker lookups
+    """
+    asset_classes = {}
+    for etf in _load_available_etfs():
+        asset_classes.setdefault(etf["symbol"], etf.get("asset_class"))
+    return asset_classes
+
+
 class ETFDBClient(BaseClient):
     def __init__(self, ticker: str, **kwargs):
         super().__init__(**kwargs)
-        if ticker.upper() in get_available_etfs_list():
+        if ticker.upper() in _get_asset_classes():
             self.ticker = ticker.upper()
             self.ticker_url = f"{self._base_url}/etf/{self.ticker}"
         else:
             raise InvalidETFException(f"{ticker} doesn't exist in ETF Database")
 
         self.asset_class = self._add_meta_information(self.ticker)
-        self._soup = self._make_soup_request()
+        self._page: Optional[bytes] = None
+        self._sections = {}
+
+    def fetch(self) -> "ETFDBClient":
+        """Downloads the etf page, sections are parsed from it on first access.
+        It's called on first access if it wasn't called before, calling it again
+        downloads the page again and drops all parsed sections.
+
+        Returns
+        -------
+        the client itself
+        """
+        self._page = self._get_page()
+        self._sections = {}
+        return self
+
+    @classmethod
+    def bulk_fetch(cls, tickers: List[str], workers: int = 8) -> List["ETFDBClient"]:
+        """Creates clients for given tickers and downloads their pages concurrently.
+
+        Parameters
+        ----------
+        tickers : List[str]
+            etf tickers to fetch
+        workers : int, default=8
+            number of pages downloaded concurrently
+
+        Returns
+        -------
+        list of fetched clients, in the order of tickers
+        """
+        clients = [cls(ticker) for ticker in tickers]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(cls.fetch, clients))
 
     @staticmethod
     def _add_meta_information(ticker):
-        for etf in _load_available_etfs():
-            if etf.get("symbol") == ticker:
-                return etf.get("asset_class")
-        return None
+        return _get_asset_classes().get(ticker)
 
     def __repr__(self):
         return f"{self.__class__.__name__}(ticker={self.ticker})"
@@ -70,20 +139,56 @@ class ETFDBClient(BaseClient):
         """Builds url for given ticker."""
         return f"{self._base_url}/etf/{self.ticker}/"
 
-    def _make_soup_request(self) -> bs4.BeautifulSoup:
-        """Make GET request to etfdb.com, and put response
-        into BeautifulSoup data structure.
+    def _get_page(self) -> bytes:
+        """Make GET request to etfdb.com for the etf page.
 
         Returns
         -------
-        BeautifulSoup object ready to parse with bs4 library
+        bytes content of the etf page
         """
         url = self._prepare_url()
         response = self._session.get(url)
         if response.status_code != 200:
             raise Exception(f"response {response.status_code}: {response.reason}")
-        return bs4.BeautifulSoup(response.text, "html.parser")
+        return response.content
+
+    def _fetched_page(self) -> bytes:
+        """Returns the etf page, downloading it if it wasn't fetched yet."""
+        if self._page is None:
+            self.fetch()
+        return self._page
+
+    @property
+    @cached_section
+    def _sections_soup(self) -> bs4.BeautifulSoup:
+        """Only the sections of the etf page read by the single-purpose methods,
+        put into BeautifulSoup data structure, so they don't have to build
+        the tree of the whole page. If the whole page was already parsed,
+        it's reused instead.
+        """
+        if "_soup" in self._sections:
+            return self._soup
+        return bs4.BeautifulSoup(
+            self._fetched_page(), HTML_PARSER, parse_only=SECTIONS_STRAINER
+        )
+
+    @property
+    @cached_section
+    def _soup(self) -> bs4.BeautifulSoup:
+        """The whole etf page put into BeautifulSoup data structure."""
+        return bs4.BeautifulSoup(self._fetched_page(), HTML_PARSER)
+
+    @property
+    @cached_section
+    def _ticker_body(self) -> bs4.element.Tag:
+        return self._soup.find("div", {"id": "etf-ticker-body"})
 
+    @property
+    @cached_section
+    def _tech(self) -> bs4.element.Tag:
+        return self._soup.find("div", {"id": "technicals-collapse"})
+
+    @cached_section
     def _profile_container(self) -> dict:
         """Parses the profile container into a dictionary.
 
@@ -91,15 +196,13 @@ class ETFDBClient(BaseClient):
             A dictionary containing the profile information.
         """
         profile_container = self._soup.find("div", {"class": "profile-container"})
-        results: List[Tuple] = []
-        for row in profile_container.find_all("div", class_="row"):
-            spans = row.find_all("span")
-            record = _handle_spans(spans)
-            if record is None:
-                continue
-            results.append(record)
-        return dict(results)
+        return {
+            record[0]: record[1]
+            for row in profile_container.find_all("div", class_="row")
+            if (record := _handle_spans(row.find_all("span", limit=2))) is not None
+        }
 
+    @cached_section
     def _trading_data(self) -> dict:
         """Parses the data-trading bar-charts-table into dictionary.
 
@@ -120,17 +223,17 @@ class ETFDBClient(BaseClient):
         }
         return {k: v for k, v in trading_dict.items() if v != ""}
 
+    @cached_section
     def _asset_categories(self) -> dict:
         """Get asset categories data"""
 
-        theme = self._soup.find("div", {"id": "etf-ticker-body"}).find_all(
-            "div", class_="ticker-assets"
-        )
+        theme = self._ticker_body.find_all("div", class_="ticker-assets")
         if not theme or len(theme) < 1:
             return {}
         theme_dict = handle_find_all_rows(theme[1].find_all("div", class_="row"))
         return theme_dict
 
+    @cached_section
     def _factset_classification(self) -> dict:
         """Get factset information"""
         factset = self._soup.find("div", {"id": "factset-classification"}).find_all(
@@ -139,14 +242,17 @@ class ETFDBClient(BaseClient):
         factset_dict = handle_find_all_rows(factset)
         return factset_dict
 
+    @cached_section
     def _number_of_holdings(self) -> dict:
         """Get number of holdings for given etf"""
-        return handle_tbody_thead(self._soup, "holdings-table")
+        return handle_tbody_thead(self._sections_soup, "holdings-table")
 
+    @cached_section
     def _size_locations(self) -> dict:
         """Get size allocations of holdings for given etf"""
-        return handle_tbody_thead(self._soup, "size-table")
+        return handle_tbody_thead(self._sections_soup, "size-table")
 
+    @cached_section
     def _valuation(self) -> dict:
         """Get ETF valuation metrics."""
         valuation = (
@@ -154,53 +260,51 @@ class ETFDBClient(BaseClient):
             .find("div", {"id": "valuation"})
             .find_all("div", class_="row")
         )
-        names = [
-            [
-                i.text.strip()
-                for i in div.find_all("div", {"class": re.compile("h4 center*")})
-            ]
-            for div in valuation
-        ][1]
+        names = [i.text.strip() for i in valuation[1].select("div.h4.center")]
         values = [
             div.text for div in valuation[1].find_all("div", class_="text-center")
         ]
         results = defaultdict(dict)
-        for name, (k, v) in zip(names, chunkify(values, 2)):
+        for name, k, v in zip(names, values[::2], values[1::2]):
             results[k][name] = v
         return dict(results)
 
+    @cached_section
     def _dividends(self) -> Dict:
         """Get ETF dividend information."""
-        return handle_tbody_thead(self._soup, "dividend-table", tag="div")
+        return handle_tbody_thead(self._sections_soup, "dividend-table", tag="div")
 
+    @cached_section
     def _holdings(self) -> List[Dict]:
         """Get ETF holdings information."""
         results = []
         try:
-            tbody = self._soup.find("div", {"id": "holding_section"}).find("tbody")
-            holdings = list(tbody.find_all("tr"))
-            for record in holdings:
+            soup = self._sections_soup
+            tbody = soup.find("div", {"id": "holding_section"}).find("tbody")
+            for record in tbody.find_all("tr"):
                 record_texts = record.find_all("td")
-                try:
-                    holding_url = record.find("a")["href"]
-                except TypeError:
+                if len(record_texts) < 3:
+                    continue
+                if (link := record.find("a")) is not None and link.get("href"):
+                    href = link["href"]
+                    holding_url = (
+                        href if self._base_url in href else f"{self._base_url}{href}"
+                    )
+                else:
                     holding_url = ""
-                texts = dict(
-                    zip(["Symbol", "Holding", "Share"], [x.text for x in record_texts])
-                )
-                holding_url = (
-                    f"{self._base_url}{holding_url}"
-                    if self._base_url not in holding_url
-                    else holding_url
+                results.append(
+                    {
+                        "Symbol": record_texts[0].text,
+                        "Holding": record_texts[1].text,
+                        "Share": record_texts[2].text,
+                        "Url": holding_url,
+                    }
                 )
-                texts.update(
-                    {"Url": "" if holding_url == self._base_url else holding_url}
-                )
-                results.append(texts)
         except AttributeError:
             results = []
         return results
 
+    @cached_section
     def _performance(self) -> Dict:
         """Get ETF performance."""
         performance = handle_tbody_thead(self._soup, "performance-collapse", tag="div")
@@ -215,13 +319,10 @@ class ETFDBClient(BaseClient):
             logger.warning("couldn't clean performance dict %s", kae)
         return cleaned_dict
 
+    @cached_section
     def _technicals(self) -> Dict:
         """Get technical analysis indicators for etf."""
-        sections = list(
-            self._soup.find("div", {"id": "technicals-collapse"}).find_all(
-                "ul", class_="list-unstyled"
-            )
-        )
+        sections = list(self._tech.find_all("ul", class_="list-unstyled"))
 
         results = []
         for section in sections:
@@ -231,63 +332,96 @@ class ETFDBClient(BaseClient):
                 logger.error(e)
         return dict(results)
 
+    @cached_section
     def _volatility(self) -> Dict:
         """Get Volatility  information."""
         metrics = [
             x.text.strip().split("\n\n\n\n")
-            for x in self._soup.find("div", {"id": "technicals-collapse"}).find_all(
-                "div", class_=re.compile("row relative-metric")
-            )
+            for x in self._tech.select("div.row.relative-metric-m-top")
         ]
         return dict(metrics)
 
+    @cached_section
     def _exposure(self) -> Dict:
         """Get ETF exposure information."""
-        charts_data = self._soup.find_all("table", class_="chart base-table")
+        soup = self._sections_soup
+        charts_data = soup.find_all("table", class_="chart base-table")
         if not charts_data:
             return {"Data": "Region, country, sector breakdown data not found"}
         parse_data = []
         chart_series = [x.get("data-chart-series") for x in charts_data]
         chart_titles = [x.get("data-title").replace("<br>", " ") for x in charts_data]
-        chart_series_dicts = [json.loads(series) for series in chart_series]
+        chart_series_dicts = [orjson.loads(series) for series in chart_series]
         for chart_dict in chart_series_dicts:
             parse_data.append({x["name"]: x["data"][0] for x in chart_dict})
 
         return dict(zip(chart_titles, parse_data))
 
+    @property
+    def profile(self) -> dict:
+        """Profile information."""
+        return self._profile_container()
+
+    @property
+    def valuation(self) -> dict:
+        """Valuation metrics."""
+        return self._valuation()
+
+    @property
+    def trading(self) -> dict:
+        """Trading data."""
+        return self._trading_data()
+
+    @property
+    def assets(self) -> dict:
+        """Asset categories."""
+        return self._asset_categories()
+
+    @property
+    def factset(self) -> dict:
+        """FactSet classification."""
+        return self._factset_classification()
+
+    def _basic_info_row(self, row: bs4.element.Tag) -> Tuple[str, str]:
+        """Parses a row of the etf ticker body into a key value pair,
+        links are returned as absolute urls."""
+        key = _handle_nth_child(row, 1)
+        value = _nth_child_selector(2).select_one(row)
+        try:
+            href = value.find("a")["href"]
+            if href and key != "ETF Home Page":
+                value_text = (
+                    href if href.startswith(self._base_url) else self._base_url + href
+                )
+            else:
+                value_text = href
+        except (KeyError, TypeError):
+            value_text = value.text.strip()
+
+        if key == "ETF Home Page":
+            value_text = value_text.removeprefix(self._base_url)
+
+        return key, value_text
+
+    @cached_section
     def _basic_info(self) -> Dict:
         """Gets basic information about ETF.
         Like profile information, trading data, valuation, assets etc.
+        Use the profile, valuation, trading, assets and factset properties
+        to get only one of these sections.
         """
-        etf_ticker_body = self._soup.find("div", {"id": "etf-ticker-body"}).find(
-            "div", class_="row"
-        )
-        basic_information = {"Symbol": self.ticker, "Url": self.ticker_url}
-
-        for row in etf_ticker_body.find_all("div", class_="row"):
-            key = _handle_nth_child(row, 1)
-            value = row.select_one(":nth-child(2)")
-            try:
-                href = value.find("a")["href"]
-                if href and key != "ETF Home Page":
-                    value_text = (
-                        href
-                        if href.startswith(self._base_url)
-                        else self._base_url + href
-                    )
-                else:
-                    value_text = href
-            except (KeyError, TypeError):
-                value_text = value.text.strip()
-
-            if key == "ETF Home Page" and value_text.startswith(self._base_url):
-                value_text.replace(self._base_url, "")
-
-            basic_information.update({key: value_text})
-
-        basic_information.update(self._profile_container())
-        basic_information.update(self._valuation())
-        basic_information.update(self._trading_data())
-        basic_information.update(self._asset_categories())
-        basic_information.update(self._factset_classification())
+        etf_ticker_body = self._ticker_body.find("div", class_="row")
+        basic_information = {
+            "Symbol": self.ticker,
+            "Url": self.ticker_url,
+            **dict(
+                self._basic_info_row(row)
+                for row in etf_ticker_body.find_all("div", class_="row")
+            ),
+        }
+        basic_information |= self.profile
+        basic_information |= self.valuation
+        basic_information |= self.trading
+        basic_information |= self.assets
+        basic_information |= self.factset
         return basic_information
@@ -37,3 +37,23 @@ def lowercase_and_underscore_column_names(func):
         return df
 
     return wrapper
+
+
+def cached_section(func):
+    """A decorator that caches the result of an ETF page section parser on the instance,
+    so every section of the scraped page is parsed only once.
+
+    Args:
+        func: A method parsing a section of the page, taking no arguments.
+
+    Returns:
+        A decorated method that returns the cached section after the first call.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self):
+        if func.__name__ not in self._sections:
+            self._sections[func.__name__] = func(self)
+        return self._sections[func.__name__]
+
+    return wrapper
@@ -8,8 +8,9 @@ class ETF(_ETFDBClient):
     """ETF Client
 
     Main class to interact with ETFDB data.
-    Under the hood when instantiated it scrapes the data for given ETF symbol e.g SPY,
-    and parse all the data for every section.
+    Under the hood it scrapes the data for given ETF symbol e.g SPY on first access
+    (or when fetch is called), and parse the data of every section when it's needed.
+    Use ETF.bulk_fetch to scrape many ETFs concurrently.
     You can access everything with ETF class properties e.g info, holdings ...
 
     """
@@ -135,7 +136,7 @@ class ETF(_ETFDBClient):
 
     @property
     def asset_categories(self) -> dict:
-        return self._asset_categories()
+        return self.assets
 
     @property
     def holding_statistics(self):
@@ -322,8 +323,10 @@ class ETF(_ETFDBClient):
         """
         data = {}
         method_list = get_class_property_methods(self.__class__)
+        # sections of the client are already part of info
+        client_properties = get_class_property_methods(_ETFDBClient)
         for m in method_list:
-            if not m.startswith("_"):
+            if not m.startswith("_") and m not in client_properties:
                 data[m.title()] = getattr(self, m)
         return data
 
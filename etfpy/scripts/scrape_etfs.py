@@ -34,8 +34,9 @@ def all_etfs_json(file_path: str = None) -> None:
     page_size = 250
     logger.info("Scraping all ETFs data from etfdb.com")
 
+    etfs = get_all_etfs(page_size)
     with open(file_path, "w") as f:
-        json.dump(get_all_etfs(page_size), f)
+        json.dump(etfs, f)
     logger.debug("ETFs data saved to %s", display_path)
 
 
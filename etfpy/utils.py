@@ -1,8 +1,10 @@
+import functools
 import inspect
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import bs4
 import requests
+import soupsieve
 from random_user_agent.params import OperatingSystem, SoftwareName
 from random_user_agent.user_agent import UserAgent
 from requests.adapters import HTTPAdapter
@@ -39,12 +41,13 @@ def get_headers() -> Dict:
     }
 
 
-def get_retry_session(retries=6, backoff_factor=0.1) -> requests.Session:
+def get_retry_session(retries=6, backoff_factor=0.1, pool_size=32) -> requests.Session:
     """Get a Session object with retry capabilities.
 
     Args:
         retries: The number of retries to attempt before giving up.
         backoff_factor: The factor by which to increase the wait time between retries.
+        pool_size: The number of keep-alive connections kept open per host.
 
     Returns:
         A Session object with retry capabilities.
@@ -57,7 +60,9 @@ def get_retry_session(retries=6, backoff_factor=0.1) -> requests.Session:
         backoff_factor=backoff_factor,
         status_forcelist=[500, 502, 503, 504, 406],
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     session.mount("https://etfdb.com", adapter)
@@ -87,6 +92,12 @@ def _handle_spans(spans) -> Optional[Tuple[Any]]:
     return None
 
 
+@functools.lru_cache()
+def _nth_child_selector(child_num: int) -> soupsieve.SoupSieve:
+    """Get a compiled :nth-child() CSS selector."""
+    return soupsieve.compile(f":nth-child({child_num})")
+
+
 def _handle_nth_child(x: bs4.element.Tag, child_num: int) -> Optional[str]:
     """Extract from beautiful soup tag a nth-child(1) stripped text
     It's utility function to handle repeated pattern in etf data scraping code
@@ -106,7 +117,7 @@ def _handle_nth_child(x: bs4.element.Tag, child_num: int) -> Optional[str]:
         stripped text from nth-child
     """
     try:
-        return x.select_one(f":nth-child({child_num})").text.strip()
+        return _nth_child_selector(child_num).select_one(x).text.strip()
     except Exception as e:
         logger.warning(str(e))
         return None
@@ -15,22 +15,22 @@ from etfpy.analytics.utils import (
     replace_value_in_df_cell,
 )
 from etfpy.etf import ETF
-from tests.utils import soup
+from tests.utils import page
 
 
 @pytest.fixture(scope="session")
-@mock.patch("etfpy.etf.ETF._make_soup_request", soup)
+@mock.patch("etfpy.etf.ETF._get_page", page)
 def etf():
-    return ETF("JEPY")
+    return ETF("JEPY").fetch()
 
 
-@mock.patch("etfpy.etf._ETFDBClient._make_soup_request", soup)
+@mock.patch("etfpy.etf._ETFDBClient._get_page", page)
 def test_should_properly_wrap_etf_to_tabular_form(etf):
     tabular_df = convert_etf_to_tabular(etf)
     assert isinstance(tabular_df, TabularEquityETFData)
 
 
-@mock.patch("etfpy.etf._ETFDBClient._make_soup_request", soup)
+@mock.patch("etfpy.etf._ETFDBClient._get_page", page)
 def test_should_tabular_form_have_dataframes_method(etf):
     tabular_df = convert_etf_to_tabular(etf)
     assert isinstance(tabular_df.info, pd.DataFrame)
@@ -29,6 +29,10 @@ def test_has_session(client):
     assert isinstance(client._requests_session, requests.Session)
 
 
+def test_clients_share_session(client):
+    assert client._session is BaseClient()._session
+
+
 def test_can_prepare_request_body(client):
     assert client._prepare_request_body() == {
         "page": 1,
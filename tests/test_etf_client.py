@@ -1,10 +1,15 @@
 from unittest import mock
 
+import bs4
+import pytest
+
 from etfpy.client.etf_client import ETFDBClient
-from tests.utils import soup
+from etfpy.exc import InvalidETFException
+from etfpy.utils import handle_find_all_rows, handle_tbody_thead
+from tests.utils import page
 
 
-@mock.patch("etfpy.client.etf_client.ETFDBClient._make_soup_request", soup)
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
 def test_basic_info():
     etf = ETFDBClient("JEPY")
     assert etf._basic_info() == {
@@ -43,7 +48,7 @@ def test_basic_info():
     }
 
 
-@mock.patch("etfpy.client.etf_client.ETFDBClient._make_soup_request", soup)
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
 def test_technicals():
     etf = ETFDBClient("JEPY")
     assert etf._technicals() == {
@@ -81,7 +86,7 @@ def test_technicals():
     }
 
 
-@mock.patch("etfpy.client.etf_client.ETFDBClient._make_soup_request", soup)
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
 def test_valuation():
     etf = ETFDBClient("JEPY")
     assert etf._valuation()["P/E Ratio"] == {
@@ -91,7 +96,7 @@ def test_valuation():
     }
 
 
-@mock.patch("etfpy.client.etf_client.ETFDBClient._make_soup_request", soup)
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
 def test_dividends():
     etf = ETFDBClient("JEPY")
     assert etf._dividends() == {
@@ -118,7 +123,7 @@ def test_dividends():
     }
 
 
-@mock.patch("etfpy.client.etf_client.ETFDBClient._make_soup_request", soup)
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
 def test_holdings():
     etf = ETFDBClient("JEPY")
     assert etf._holdings() == [
@@ -133,7 +138,7 @@ def test_holdings():
     ]
 
 
-@mock.patch("etfpy.client.etf_client.ETFDBClient._make_soup_request", soup)
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
 def test_number_of_holdings():
     etf = ETFDBClient("JEPY")
     assert etf._number_of_holdings() == {
@@ -160,7 +165,7 @@ def test_number_of_holdings():
     }
 
 
-@mock.patch("etfpy.client.etf_client.ETFDBClient._make_soup_request", soup)
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
 def test_performance():
     etf = ETFDBClient("JEPY")
     assert etf._performance() == {
@@ -195,3 +200,183 @@ def test_performance():
             "Factset Segment Average": "2.08%",
         },
     }
+
+
+def test_soup_parses_response_content():
+    response = mock.Mock(status_code=200, content=page())
+    session = mock.Mock(**{"get.return_value": response})
+    with mock.patch(
+        "etfpy.client.etf_client.ETFDBClient._session",
+        new_callable=mock.PropertyMock,
+        return_value=session,
+    ):
+        etf = ETFDBClient("JEPY")
+        session.get.assert_not_called()
+        assert etf._soup.find("div", {"id": "etf-ticker-body"}) is not None
+    session.get.assert_called_once_with("https://etfdb.com/etf/JEPY/")
+
+
+def test_fetch():
+    with mock.patch(
+        "etfpy.client.etf_client.ETFDBClient._get_page", side_effect=page
+    ) as m:
+        etf = ETFDBClient("JEPY")
+        m.assert_not_called()
+        assert etf.fetch() is etf
+        holdings = etf._holdings()
+        etf._basic_info()
+        assert etf.fetch()._holdings() is not holdings
+        assert "_soup" not in etf._sections
+        assert m.call_count == 2
+
+
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
+def test_bulk_fetch():
+    clients = ETFDBClient.bulk_fetch(["JEPY", "spy", "QQQ"], workers=2)
+    assert [c.ticker for c in clients] == ["JEPY", "SPY", "QQQ"]
+    assert all(c._page == page() for c in clients)
+
+
+def _count_soups():
+    return mock.patch.object(
+        bs4.BeautifulSoup,
+        "__init__",
+        autospec=True,
+        side_effect=bs4.BeautifulSoup.__init__,
+    )
+
+
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
+def test_sections_are_parsed_once():
+    etf = ETFDBClient("JEPY")
+    holdings = etf._holdings()
+    with _count_soups() as soup:
+        assert etf._holdings() is holdings
+    soup.assert_not_called()
+
+
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
+def test_single_sections_dont_parse_whole_page():
+    etf = ETFDBClient("JEPY")
+    assert len(etf._holdings()) == 3
+    assert "Number of Holdings" in etf._number_of_holdings()
+    assert etf._size_locations()
+    assert etf._dividends()
+    assert "Asset Allocation" in etf._exposure()
+    assert "_soup" not in etf._sections
+
+    etf = ETFDBClient("JEPY")
+    etf._basic_info()
+    assert etf._sections_soup is etf._soup
+
+
+@pytest.mark.parametrize(
+    "sections, parses",
+    [
+        (["_holdings", "_number_of_holdings", "_size_locations", "_dividends"], 1),
+        (["_exposure", "_holdings", "_exposure", "_number_of_holdings"], 1),
+        (["_holdings", "_number_of_holdings", "_size_locations", "_basic_info"], 2),
+        (["_basic_info", "_dividends", "_exposure", "_holdings"], 1),
+        (["_exposure", "_performance", "_volatility", "_dividends"], 2),
+    ],
+)
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
+def test_page_parses(sections, parses):
+    etf = ETFDBClient("JEPY")
+    with _count_soups() as soup:
+        for section in sections:
+            getattr(etf, section)()
+    assert soup.call_count == parses
+
+
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
+def test_exposure():
+    etf = ETFDBClient("JEPY")
+    assert etf._exposure() == {
+        "Asset Allocation": {"CASH": 98.89, "Open-ended Fund": 1.35, "Other": -0.24},
+        "Country Breakdown": {"Other": 100},
+        "Market Cap Breakdown": {"Large": 0, "Micro": 0, "Mid": 0, "Small": 0},
+        "Market Tier Breakdown": {},
+        "Region Breakdown": {
+            "North, Central and South America": 1.35,
+            "Other": 98.65,
+        },
+        "Sector Breakdown": {"CASH": 98.89, "Miscellaneous": 1.35, "Other": -0.24},
+    }
+
+
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
+def test_volatility():
+    etf = ETFDBClient("JEPY")
+    assert etf._volatility() == {
+        "5 Day Volatility": "11.01%",
+        "20 Day Volatility": "No Ranking Available",
+        "50 Day Volatility": "No Ranking Available",
+        "200 Day Volatility": "No Ranking Available",
+        "Beta": "No Ranking Available",
+        "Standard Deviation": "No Ranking Available",
+    }
+
+
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
+def test_invalid_ticker():
+    with pytest.raises(InvalidETFException):
+        ETFDBClient("NOT_AN_ETF")
+
+
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
+def test_asset_class():
+    assert ETFDBClient("spy").asset_class == "Equity"
+    assert ETFDBClient._add_meta_information("NOT_AN_ETF") is None
+
+
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
+def test_basic_info_row():
+    etf = ETFDBClient("JEPY")
+
+    def row(key, href):
+        html = f'<div><span>{key}</span><span><a href="{href}">link</a></span></div>'
+        return bs4.BeautifulSoup(html, "html.parser").div
+
+    assert etf._basic_info_row(row("Issuer", "/issuer/tidal/")) == (
+        "Issuer",
+        "https://etfdb.com/issuer/tidal/",
+    )
+    assert etf._basic_info_row(row("ETF Home Page", "https://etfdb.com/jepy/")) == (
+        "ETF Home Page",
+        "/jepy/",
+    )
+    assert etf._basic_info_row(row("ETF Home Page", "https://jepy.com/")) == (
+        "ETF Home Page",
+        "https://jepy.com/",
+    )
+
+
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
+def test_basic_info_sections():
+    etf = ETFDBClient("JEPY")
+    assert etf.valuation == etf._valuation()
+    assert etf.valuation is etf.valuation
+    assert etf.assets == etf._asset_categories()
+    assert etf.factset["Strategy"] == "Active"
+    assert etf.trading["AUM"] == "$0.0 M"
+
+
+@mock.patch("etfpy.client.etf_client.ETFDBClient._get_page", page)
+def test_shared_sections_are_parsed_once():
+    etf = ETFDBClient("JEPY")
+    with mock.patch(
+        "etfpy.client.etf_client.handle_find_all_rows",
+        side_effect=handle_find_all_rows,
+    ) as find_all_rows, mock.patch(
+        "etfpy.client.etf_client.handle_tbody_thead", side_effect=handle_tbody_thead
+    ) as tbody_thead:
+        info = etf._basic_info()
+        etf._holdings()
+        assert etf.assets["Asset Class"] == info["Asset Class"]
+        assert etf.factset["Strategy"] == info["Strategy"]
+        etf._number_of_holdings()
+        etf._number_of_holdings()
+    # asset categories and factset classification
+    assert find_all_rows.call_count == 2
+    tbody_thead.assert_called_once()
@@ -233,6 +233,25 @@ def test_can_prepare_etfs_list(etf_scraper_client, etfs):
     ]
 
 
+def test_prepare_etfs_list_matches_parsed_records(etf_scraper_client):
+    data = ScrapedPage().data
+    assert etf_scraper_client._prepare_etfs_list(data) == [
+        etf_scraper_client._parse_etf_record(etf) for etf in data
+    ]
+    assert etf_scraper_client._prepare_etfs_list([]) == []
+
+
+def test_prepare_etfs_list_keeps_values_of_partial_records(etf_scraper_client):
+    data = [
+        {"symbol": {"text": "A", "url": "/a/"}, "average_volume": 100},
+        {"name": {"text": "B"}},
+    ]
+    records = etf_scraper_client._prepare_etfs_list(data)
+    assert records == [etf_scraper_client._parse_etf_record(etf) for etf in data]
+    assert type(records[0]["average_volume"]) is int
+    assert records[1]["url"] is None and records[1]["average_volume"] is None
+
+
 @mock.patch("etfpy.client._etfs_scraper.ETFListScraper.post_request")
 def test_scrape_page(m, etf_scraper_client):
     fake_page = ScrapedPage()
@@ -246,12 +265,72 @@ def test_scrape_page(m, etf_scraper_client):
     assert page == []
 
 
+def _fetch_page(page, page_size, max_pages=3):
+    return {"data": _scrape_page(page, page_size, max_pages)}
+
+
 def test_should_get_etfs(etf_scraper_client):
+    etf_scraper_client._fetch_page = _fetch_page
     etf_scraper_client._scrape_page = _scrape_page
     results = list(etf_scraper_client.get_etfs(10))
     assert len(results) == 3 and len(results[0]) == 10
 
 
+def test_should_get_etfs_using_number_of_pages(etf_scraper_client):
+    def fetch_page(page, page_size):
+        return {"meta": {"total_records": 25}, **_fetch_page(page, page_size)}
+
+    etf_scraper_client._fetch_page = fetch_page
+    etf_scraper_client._scrape_page = mock.Mock(side_effect=_scrape_page)
+    results = list(etf_scraper_client.get_etfs(10))
+    assert len(results) == 3 and len(results[0]) == 10
+    calls = etf_scraper_client._scrape_page.call_args_list
+    assert sorted(c.args[0] for c in calls) == [2, 3]
+
+
+def test_should_get_etfs_when_server_caps_page_size(etf_scraper_client):
+    def fetch_page(page, page_size):
+        return {"meta": {"total_records": 25}, **_fetch_page(page, page_size)}
+
+    etf_scraper_client._fetch_page = fetch_page
+    etf_scraper_client._scrape_page = mock.Mock(side_effect=_scrape_page)
+    results = list(etf_scraper_client.get_etfs(250))
+    assert len(results) == 3
+    calls = etf_scraper_client._scrape_page.call_args_list
+    assert sorted(c.args[0] for c in calls) == [2, 3]
+
+
+def test_should_retry_failed_page(etf_scraper_client):
+    def fetch_page(page, page_size):
+        return {"meta": {"total_records": 30}, **_fetch_page(page, page_size)}
+
+    etf_scraper_client._fetch_page = fetch_page
+    etf_scraper_client._scrape_page = mock.Mock(
+        side_effect=[ScrapedPage().data, [], ScrapedPage().data]
+    )
+    results = list(etf_scraper_client.get_etfs(10, max_workers=1))
+    assert len(results) == 3
+    assert etf_scraper_client._scrape_page.call_args_list[-1].args == (3, 10)
+
+
+def test_should_raise_when_page_keeps_failing(etf_scraper_client):
+    def fetch_page(page, page_size):
+        return {"meta": {"total_records": 30}, **_fetch_page(page, page_size)}
+
+    etf_scraper_client._fetch_page = fetch_page
+    etf_scraper_client._scrape_page = mock.Mock(return_value=[])
+    with pytest.raises(Exception, match="page 2 of 3"):
+        list(etf_scraper_client.get_etfs(10))
+
+
+def test_should_count_pages(etf_scraper_client):
+    assert etf_scraper_client._count_pages({"total_pages": 4}, 10) == 4
+    assert etf_scraper_client._count_pages({"total_records": 31}, 10) == 4
+    assert etf_scraper_client._count_pages({"total_records": 30}, 10) == 3
+    assert etf_scraper_client._count_pages({}, 10) is None
+    assert etf_scraper_client._count_pages({"total_records": "n/a"}, 10) is None
+
+
 @mock.patch("etfpy.client._etfs_scraper.ETFListScraper.get_etfs")
 def test_get_all_etfs(m):
     data = ScrapedPage().data
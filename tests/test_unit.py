@@ -35,6 +35,10 @@ def test_should_create_retry_session():
         assert adapter.max_retries.total == max_retries
         assert isinstance(adapter, requests.adapters.HTTPAdapter)
 
+    session = get_retry_session(pool_size=8)
+    for adapter in session.adapters.values():
+        assert adapter._pool_maxsize == 8
+
 
 def test_should_handle_spans():
     html = (
@@ -102,3 +106,21 @@ def test_should_handle_nth_span():
     ).find("tr")
     assert _handle_nth_child(soup, 1) == "1"
     assert _handle_nth_child(5, 12) is None
+
+
+def test_should_keep_spaces_in_mixed_content_cells():
+    soup = bs4.BeautifulSoup(
+        "<table id='my_table'><thead><tr><th>Size</th><th>Style</th></tr></thead>"
+        "<tbody><tr><td>Large</td><td> Large <b>Cap</b> Growth </td></tr>"
+        "</tbody></table>",
+        "html.parser",
+    )
+    assert handle_tbody_thead(soup, table_id="my_table") == {
+        "Large": {"Style": "Large Cap Growth"}
+    }
+    assert _handle_nth_child(soup.find("tbody").tr, 2) == "Large Cap Growth"
+    assert _handle_spans(
+        bs4.BeautifulSoup(
+            "<span>Issuer</span><span>Big <i>Fund</i> Co</span>", "html.parser"
+        ).find_all("span")
+    ) == ("Issuer", "Big Fund Co")
@@ -1,14 +1,12 @@
 import os.path
 from pathlib import Path
 
-import bs4
-
 here = Path(__file__).parent
 
 
-def soup(*args, **kwargs):
-    with open(os.path.join(here, "data/jepy.html"), encoding="utf8") as f:
-        data = bs4.BeautifulSoup(f, "html.parser")
+def page(*args, **kwargs):
+    with open(os.path.join(here, "data/jepy.html"), "rb") as f:
+        data = f.read()
     return data
 
 